@@ -440,6 +440,21 @@ def _fill_or_assign(df, column, default):
         df[column] = default
 
 
+def _edges_from_networkx(graph, attrs):
+    # like nx.to_pandas_edgelist, but only building the columns for the given attributes, rather
+    # than for every attribute that appears on any edge
+    edges = list(graph.edges(data=True))
+    columns = {
+        SOURCE: [src for src, _, _ in edges],
+        TARGET: [tgt for _, tgt, _ in edges],
+    }
+    for attr in attrs:
+        if any(attr in data for _, _, data in edges):
+            columns[attr] = [data.get(attr, np.nan) for _, _, data in edges]
+
+    return pd.DataFrame(columns)
+
+
 def from_networkx(
     graph,
     *,
@@ -451,8 +466,6 @@ def from_networkx(
     node_features,
     dtype,
 ):
-    import networkx as nx
-
     nodes = defaultdict(_empty_node_info)
 
     features_in_node = isinstance(node_features, str)
@@ -479,7 +492,7 @@ def from_networkx(
             nodes, node_type_default, node_features, dtype
         )
 
-    edges = nx.to_pandas_edgelist(graph, source=SOURCE, target=TARGET)
+    edges = _edges_from_networkx(graph, [edge_type_attr, edge_weight_attr])
     _fill_or_assign(edges, edge_type_attr, edge_type_default)
     _fill_or_assign(edges, edge_weight_attr, DEFAULT_WEIGHT)
     edges_limited_columns = edges[[SOURCE, TARGET, edge_type_attr, edge_weight_attr]]
@@ -662,6 +662,31 @@ class StellarGraph:
             return ilocs
         return self._nodes.ids.from_iloc(ilocs)
 
+    def node_arrays(self, include_node_type=False, use_ilocs=False) -> tuple:
+        """
+        Obtains the collection of nodes in the graph as a tuple of arrays (ids, types). ``types``
+        will be `None` if ``include_node_type`` is not specified.
+
+        These come directly from the graph's columnar storage, so, unlike calling
+        :meth:`node_type` on every node, no node ID lookups are required.
+
+        Args:
+            include_node_type (bool): A flag that indicates whether to return node types.
+            use_ilocs (bool): if True return :ref:`ilocs for nodes (and node types) <iloc-explanation>`
+
+        Returns:
+            A tuple containing 1D arrays of the nodes and their types (ids, types). Setting
+            include_node_type to True will include an array of node types in this tuple, otherwise
+            it will be set to ``None``.
+        """
+        if use_ilocs:
+            ids = np.arange(self.number_of_nodes())
+            types = self._nodes.type_ilocs if include_node_type else None
+        else:
+            ids = self._nodes.ids.pandas_index.to_numpy()
+            types = self._nodes.type_of_iloc(slice(None)) if include_node_type else None
+        return ids, types
+
     def _to_edges(self, edge_arrs):
         edges = list(zip(*(arr for arr in edge_arrs[:3] if arr is not None)))
         if edge_arrs[3] is not None:
@@ -983,20 +1008,18 @@ class StellarGraph:
         Returns:
             Node type or numpy array of node types
         """
-        if is_real_iterable(node):
-            nodes = node
-        else:
-            nodes = [node]
+        if not is_real_iterable(node):
+            # a single node: look up its position and type iloc directly, because the vectorised
+            # conversions have a high fixed cost for each call
+            node_iloc = (
+                node if use_ilocs else self._nodes.ids.pandas_index.get_loc(node)
+            )
+            return self._nodes.types.from_iloc(self._nodes.type_ilocs[node_iloc])
 
+        nodes = node
         if not use_ilocs:
             nodes = self._nodes.ids.to_iloc(nodes, strict=True)
-        type_sequence = self._nodes.type_of_iloc(nodes)
-
-        if is_real_iterable(node):
-            return type_sequence
-
-        assert len(type_sequence) == 1
-        return type_sequence[0]
+        return self._nodes.type_of_iloc(nodes)
 
     @property
     def node_types(self):
@@ -1297,7 +1320,7 @@ class StellarGraph:
     ##################################################################
     # Computationally intensive methods:
 
-    def _edge_type_iloc_triples(self, selector=slice(None), stacked=False):
+    def _edge_type_iloc_triples(self, selector=slice(None)):
         source_ilocs = self._edges.sources[selector]
         source_type_ilocs = self._nodes.type_ilocs[source_ilocs]
 
@@ -1306,16 +1329,10 @@ class StellarGraph:
         target_ilocs = self._edges.targets[selector]
         target_type_ilocs = self._nodes.type_ilocs[target_ilocs]
 
-        all_ilocs = source_type_ilocs, rel_type_ilocs, target_type_ilocs
-        if stacked:
-            return np.stack(all_ilocs, axis=-1)
-
-        return all_ilocs
+        return source_type_ilocs, rel_type_ilocs, target_type_ilocs
 
     def _edge_type_triples(self, selector=slice(None)):
-        src_ilocs, rel_ilocs, tgt_ilocs = self._edge_type_iloc_triples(
-            selector, stacked=False
-        )
+        src_ilocs, rel_ilocs, tgt_ilocs = self._edge_type_iloc_triples(selector)
 
         return (
             self._nodes.types.from_iloc(src_ilocs),
@@ -1323,24 +1340,33 @@ class StellarGraph:
             self._nodes.types.from_iloc(tgt_ilocs),
         )
 
-    def _unique_type_triples(self, selector=slice(None)):
-        all_type_ilocs = self._edge_type_iloc_triples(selector, stacked=True)
+    def _unique_type_triples(self, selector=slice(None), include_reversed=False):
+        src_ilocs, rel_ilocs, tgt_ilocs = self._edge_type_iloc_triples(selector)
 
-        if len(all_type_ilocs) == 0:
-            # FIXME(https://github.com/numpy/numpy/issues/15559): if there's no edges, np.unique is
-            # being called on a shape=(0, 3) ndarray, and hits "ValueError: cannot reshape array of
-            # size 0 into shape (0,newaxis)", so we manually reproduce what would be returned
-            ret = None, []
-        else:
-            ret = np.unique(all_type_ilocs, axis=0, return_index=True)
+        # pack each (source type, edge type, target type) triple into a single integer, so that
+        # deduplication is a 1D sort of one compact column, rather than a (much slower) row-wise
+        # np.unique over a stacked array; the codes sort in the same order as the triples
+        num_node_types = len(self._nodes.types)
+        num_edge_types = len(self._edges.types)
 
-        edge_ilocs = ret[1]
-        # we've now got the indices for an edge with each triple, along with the counts of them, so
-        # we can query to get the actual edge types (this is, at the time of writing, easier than
-        # getting the actual type for each type iloc in the triples)
-        unique_ets = self._edge_type_triples(edge_ilocs)
+        def pack(n1, rel, n2):
+            return (n1.astype(np.int64) * num_edge_types + rel) * num_node_types + n2
 
-        return zip(*unique_ets)
+        codes = pack(src_ilocs, rel_ilocs, tgt_ilocs)
+        if include_reversed:
+            # the edge n1-rel->n2 also gives the triple n2-rel->n1 (for undirected graphs), so
+            # include the reversed triples in the same deduplication pass
+            codes = np.concatenate([codes, pack(tgt_ilocs, rel_ilocs, src_ilocs)])
+
+        unique_codes = np.unique(codes)
+        n1_rel, n2 = np.divmod(unique_codes, num_node_types)
+        n1, rel = np.divmod(n1_rel, num_edge_types)
+
+        return zip(
+            self._nodes.types.from_iloc(n1),
+            self._edges.types.from_iloc(rel),
+            self._nodes.types.from_iloc(n2),
+        )
 
     def _edge_metrics_by_type_triple(self, metrics):
         src_ty, rel_ty, tgt_ty = self._edge_type_triples()
@@ -1398,7 +1424,16 @@ class StellarGraph:
             truncate_edge_types_per_node = min(truncate_edge_types_per_node, truncate)
 
         # Numpy processing is much faster than NetworkX processing, so we don't bother sampling.
-        gs = self.create_graph_schema()
+        metric_names = ["count", "min", "max", "mean", "std"]
+        et_metrics = self._edge_metrics_by_type_triple(metrics=metric_names)
+
+        # the edge types incident to each node type (matching the GraphSchema.schema of the graph)
+        # can be read off the per-triple metrics, rather than creating the full graph schema
+        edge_types_by_node_type = {nt: set() for nt in self.node_types}
+        for n1, rel, n2 in et_metrics.index:
+            edge_types_by_node_type[n1].add(EdgeType(n1, rel, n2))
+            if not self.is_directed():
+                edge_types_by_node_type[n2].add(EdgeType(n2, rel, n1))
 
         node_feature_info = self._nodes.feature_info()
         edge_feature_info = self._edges.feature_info()
@@ -1418,10 +1453,10 @@ class StellarGraph:
 
         def str_node_type(count, nt):
             feature_text = str_feature(node_feature_info, nt)
-            edges = gs.schema[nt]
+            edges = sorted(edge_types_by_node_type[nt])
             if edges:
                 edge_types = comma_sep(
-                    [str_edge_type(et) for et in gs.schema[nt]],
+                    [str_edge_type(et) for et in edges],
                     limit=truncate_edge_types_per_node,
                     stringify=str,
                 )
@@ -1440,9 +1475,11 @@ class StellarGraph:
 
             return f"{str_edge_type(et)}: [{metrics.count}]\n        Weights: {weights_text}\n        Features: {feature_text}"
 
-        # sort the node types in decreasing order of frequency
+        # sort the node types in decreasing order of frequency (nodes are stored contiguously by
+        # type, so the count is the length of the type's range, without materialising any IDs)
         node_types = sorted(
-            ((len(self.nodes(node_type=nt)), nt) for nt in gs.node_types), reverse=True
+            ((len(self._nodes.type_range(nt)), nt) for nt in self.node_types),
+            reverse=True,
         )
         nodes = separated(
             [str_node_type(count, nt) for count, nt in node_types],
@@ -1451,9 +1488,6 @@ class StellarGraph:
             sep="\n  ",
         )
 
-        metric_names = ["count", "min", "max", "mean", "std"]
-        et_metrics = self._edge_metrics_by_type_triple(metrics=metric_names)
-
         edge_types = sorted(
             (
                 (metrics.count, EdgeType(*metrics.Index), metrics,)
@@ -1500,35 +1534,37 @@ class StellarGraph:
             GraphSchema object.
         """
 
-        graph_schema = {nt: set() for nt in self.node_types}
-        edge_types = set()
-
         if nodes is None:
             selector = slice(None)
         else:
             node_ilocs = self._nodes.ids.to_iloc(nodes)
-            selector = np.isin(self._edges.sources, node_ilocs) & np.isin(
-                self._edges.targets, node_ilocs
-            )
-
-        for n1, rel, n2 in self._unique_type_triples(selector=selector):
-            edge_type_tri = EdgeType(n1, rel, n2)
-            edge_types.add(edge_type_tri)
-            graph_schema[n1].add(edge_type_tri)
-
-            if not self.is_directed():
-                edge_type_tri = EdgeType(n2, rel, n1)
-                edge_types.add(edge_type_tri)
-                graph_schema[n2].add(edge_type_tri)
+            # flag the requested nodes once, so that each edge endpoint is a direct lookup rather
+            # than a search of node_ilocs (as with np.isin)
+            in_nodes = np.zeros(self.number_of_nodes(), dtype=bool)
+            in_nodes[node_ilocs[self._nodes.ids.is_valid(node_ilocs)]] = True
+            selector = in_nodes[self._edges.sources] & in_nodes[self._edges.targets]
+
+        # the triples are unique, and, for undirected graphs, already include both orientations
+        unique_triples = self._unique_type_triples(
+            selector=selector, include_reversed=not self.is_directed()
+        )
 
-        # Create ordered list of edge_types
-        edge_types = sorted(edge_types)
+        # Create ordered list of edge_types: the unique triples are ordered by their type ilocs,
+        # which is also the order of the type names when the types are stored sorted (as they are
+        # for a normally constructed graph), so the sort of the named tuples can usually be skipped
+        edge_types = [EdgeType(n1, rel, n2) for n1, rel, n2 in unique_triples]
+        types_stored_sorted = (
+            self._nodes.types.pandas_index.is_monotonic_increasing
+            and self._edges.types.pandas_index.is_monotonic_increasing
+        )
+        if not types_stored_sorted:
+            edge_types.sort()
 
-        # Create keys for node and edge types
-        schema = {
-            node_label: sorted(node_data)
-            for node_label, node_data in graph_schema.items()
-        }
+        # Create keys for node and edge types: the edge types are sorted by source node type first,
+        # so bucketing them in order leaves each node type's list sorted too
+        schema = {nt: [] for nt in self.node_types}
+        for edge_type_tri in edge_types:
+            schema[edge_type_tri.n1].append(edge_type_tri)
 
         return GraphSchema(
             self.is_directed(), sorted(self.node_types), edge_types, schema
@@ -1852,9 +1888,8 @@ class StellarGraph:
         """
         # self loops should only be counted once, which means they're effectively always a directed
         # edge at the storage level, unlikely other edges in an undirected graph. This is
-        # particularly important with the intersection1d call, where the source_ilocs and
-        # target_ilocs will be equal, when source_node == target_node, and thus the intersection
-        # will contain all incident edges.
+        # particularly important for matching the other endpoint below: when source_node ==
+        # target_node, every edge incident to source_node would match in an undirected lookup.
         effectively_directed = self.is_directed() or source_node == target_node
         both_dirs = not effectively_directed
 
@@ -1862,14 +1897,18 @@ class StellarGraph:
             source_node = self._nodes.ids.to_iloc([source_node])[0]
             target_node = self._nodes.ids.to_iloc([target_node])[0]
 
+        # only look up the source's edges, rather than both nodes' edges and intersecting them:
+        # every one of these edges has source_node as an endpoint, so it joins the pair exactly when
+        # target_node is the other endpoint
         source_edge_ilocs = self._edges.edge_ilocs(
             source_node, ins=both_dirs, outs=True
         )
-        target_edge_ilocs = self._edges.edge_ilocs(
-            target_node, ins=True, outs=both_dirs
-        )
+        matches = self._edges.targets[source_edge_ilocs] == target_node
+        if both_dirs:
+            matches |= self._edges.sources[source_edge_ilocs] == target_node
 
-        ilocs = np.intersect1d(source_edge_ilocs, target_edge_ilocs, assume_unique=True)
+        # sort, to match the order of the edges in the graph
+        ilocs = np.sort(source_edge_ilocs[matches])
 
         return [float(x) for x in self._edges.weights[ilocs]]
 
@@ -14,9 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import queue
 import warnings
-from collections.__init__ import namedtuple
+from collections import deque, namedtuple
 from ..core.utils import is_real_iterable
 
 EdgeType = namedtuple("EdgeType", "n1 rel n2")
@@ -36,6 +35,21 @@ class GraphSchema:
         self.edge_types = edge_types
         self.schema = schema
 
+        # map type names to their positions, so that index queries don't need a linear scan
+        self._node_type_index = {nt: ii for ii, nt in enumerate(node_types)}
+        self._edge_type_index = {et: ii for ii, et in enumerate(edge_types)}
+
+        # for each node type index, the node type indices of the targets of its (ordered) edge
+        # types, so that walking the schema for sampling is just integer indexing
+        self._target_type_indices = [
+            tuple(self._node_type_index[et.n2] for et in schema[nt])
+            for nt in node_types
+        ]
+
+        # the sampling trees only depend on the (fixed) schema and their arguments, so they're
+        # computed once for each (head node types, number of hops) pair that's requested
+        self._type_adjacency_lists = {}
+
     def __repr__(self):
         s = "{}:\n".format(type(self).__name__)
         for nt in self.schema:
@@ -57,13 +71,11 @@ class GraphSchema:
         Returns:
             Numerical node type index
         """
-        try:
-            index = self.node_types.index(name)
-        except ValueError:
+        index = self._node_type_index.get(name)
+        if index is None:
             warnings.warn(
                 "Node key '{}' not found.".format(name), RuntimeWarning, stacklevel=2
             )
-            index = None
         return index
 
     def edge_index(self, edge_type):
@@ -76,10 +88,8 @@ class GraphSchema:
         Returns:
             Numerical edge type index
         """
-        if edge_type in self.edge_types:
-            index = self.edge_types.index(edge_type)
-
-        else:
+        index = self._edge_type_index.get(edge_type)
+        if index is None:
             raise ValueError("Edge key '{}' not found.".format(edge_type))
 
         return index
@@ -101,14 +111,16 @@ class GraphSchema:
         """
         adjacency_list = self.type_adjacency_list(head_node_types, n_hops)
 
-        def pack_tree(nodes, level):
-            return [
-                (n, adjacency_list[n][0], pack_tree(adjacency_list[n][1], level + 1))
-                for n in nodes
-            ]
+        # the unique ID of each sampling node is its (integer) index in the adjacency list; children
+        # always come after their parent, so building the subtrees from the end of the list (rather
+        # than recursing from the heads) means every node's children have already been packed
+        trees = [None] * len(adjacency_list)
+        for n in reversed(range(len(adjacency_list))):
+            node_type, children = adjacency_list[n]
+            trees[n] = (n, node_type, [trees[child] for child in children])
 
         # The first k nodes will be the head nodes in the adjacency list
-        return adjacency_list, pack_tree(range(len(head_node_types)), 0)
+        return adjacency_list, trees[: len(head_node_types)]
 
     def sampling_layout(self, head_node_types, num_samples):
         """
@@ -128,7 +140,7 @@ class GraphSchema:
             used to reformat the samples given by `SampledBreadthFirstWalk` to
             that expected by the HinSAGE model.
         """
-        adjacency_list = self.type_adjacency_list(head_node_types, len(num_samples))
+        adjacency_list = self._type_adjacency_list(head_node_types, len(num_samples))
         sample_index_layout = []
         sample_inverse_layout = []
 
@@ -143,7 +155,7 @@ class GraphSchema:
             adj_to_samples[ii][1].append(0)
 
             # Set the start group as the head node and point the index to the next hop
-            node_groups = [(ii, hnt)]
+            node_groups = [(ii, self._node_type_index[hnt])]
             sample_index = 1
 
             # Iterate over all hops
@@ -151,15 +163,15 @@ class GraphSchema:
                 next_node_groups = []
                 for a_key, nt1 in node_groups:
                     # For each node we sample from all edge types from that node
-                    edge_types = self.schema[nt1]
+                    target_types = self._target_type_indices[nt1]
 
                     # We want to place the samples for these edge types in the correct
                     # place in the adjacency list
                     next_keys = adjacency_list[a_key][1]
 
-                    for et, next_key in zip(edge_types, next_keys):
+                    for nt2, next_key in zip(target_types, next_keys):
                         # These are psueo-samples for each edge type
-                        sample_types = [(next_key, et.n2)] * nsamples
+                        sample_types = [(next_key, nt2)] * nsamples
                         next_node_groups.extend(sample_types)
 
                         # Store the node type, adjacency and sampling indices
@@ -168,7 +180,7 @@ class GraphSchema:
                         sample_index += 1
 
                         # Sanity check
-                        assert adj_to_samples[next_key][0] == et.n2
+                        assert adj_to_samples[next_key][0] == self.node_types[nt2]
 
                 node_groups = next_node_groups
 
@@ -196,34 +208,48 @@ class GraphSchema:
         Returns:
             List of form ``[ (node_type, [children]), ...]``
         """
+        # copy the children lists, so that modifying the result doesn't affect the cached value
+        return [
+            (nt, list(children))
+            for nt, children in self._type_adjacency_list(head_node_types, n_hops)
+        ]
+
+    def _type_adjacency_list(self, head_node_types, n_hops):
+        """
+        The same as :meth:`type_adjacency_list`, except the returned value is shared between calls
+        with the same arguments, and so must not be modified.
+        """
         if not isinstance(head_node_types, (list, tuple)):
             raise TypeError("The head node types should be a list or tuple.")
 
         if not isinstance(n_hops, int):
             raise TypeError("n_hops should be an integer")
 
-        to_process = queue.Queue()
+        key = (tuple(head_node_types), n_hops)
+        cached = self._type_adjacency_lists.get(key)
+        if cached is not None:
+            return cached
+
+        to_process = deque()
 
         # Add head nodes
         clist = list()
         for ii, hn in enumerate(head_node_types):
             if n_hops > 0:
-                to_process.put((hn, ii, 0))
+                to_process.append((self._node_type_index[hn], ii, 0))
             clist.append((hn, []))
 
-        while not to_process.empty():
-            # Get node, node index, and level
-            nt, ninx, lvl = to_process.get()
-
-            # The ordered list of edge types from this node type
-            ets = self.schema[nt]
+        while to_process:
+            # Get node type index, node index, and level
+            nt, ninx, lvl = to_process.popleft()
 
-            # Iterate over edge types (in order)
-            for et in ets:
+            # Iterate over the target node types of the edge types from this node type (in order)
+            for nt2 in self._target_type_indices[nt]:
                 cinx = len(clist)
-                clist.append((et.n2, []))
+                clist.append((self.node_types[nt2], []))
                 clist[ninx][1].append(cinx)
                 if n_hops > lvl + 1:
-                    to_process.put((et.n2, cinx, lvl + 1))
+                    to_process.append((nt2, cinx, lvl + 1))
 
+        self._type_adjacency_lists[key] = clist
         return clist
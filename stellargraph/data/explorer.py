@@ -778,13 +778,16 @@ class SampledHeterogeneousBreadthFirstWalk(GraphWalk):
         walks = []
         d = len(n_size)  # depth of search
 
-        for node in nodes:  # iterate over root nodes
+        # look up the types of all the root nodes at once, rather than once per walk
+        node_types = self.graph.node_type(nodes, use_ilocs=True)
+
+        # iterate over root nodes
+        for node, node_type in zip(nodes, node_types):
             for _ in range(n):  # do n bounded breadth first walks from each root node
                 q = list()  # the queue of neighbours
                 walk = list()  # the list of nodes in the subgraph of node
 
                 # Start the walk by adding the head node, and node type to the frontier list q
-                node_type = self.graph.node_type(node, use_ilocs=True)
                 q.extend([(node, node_type, 0)])
 
                 # add the root node to the walks
@@ -293,7 +293,7 @@ class GraphSAGELinkGenerator(BatchedLinkGenerator):
         # Reshape node samples to sensible format
         def get_levels(loc, lsize, samples_per_hop, walks):
             end_loc = loc + lsize
-            walks_at_level = list(it.chain(*[w[loc:end_loc] for w in walks]))
+            walks_at_level = list(it.chain.from_iterable(w[loc:end_loc] for w in walks))
             if len(samples_per_hop) < 1:
                 return [walks_at_level]
             return [walks_at_level] + get_levels(
@@ -471,10 +471,12 @@ class HinSAGELinkGenerator(BatchedLinkGenerator):
                 [
                     (
                         nt,
-                        reduce(
-                            operator.concat,
-                            (samples[ks] for samples in node_samples for ks in indices),
-                            [],
+                        list(
+                            it.chain.from_iterable(
+                                samples[ks]
+                                for samples in node_samples
+                                for ks in indices
+                            )
                         ),
                     )
                     for nt, indices in self._sampling_schema[ii]
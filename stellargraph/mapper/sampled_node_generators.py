@@ -27,7 +27,6 @@ __all__ = [
 ]
 
 import warnings
-import operator
 import random
 import abc
 import warnings
@@ -36,7 +35,6 @@ import itertools as it
 import networkx as nx
 import scipy.sparse as sps
 from tensorflow.keras import backend as K
-from functools import reduce
 from tensorflow.keras.utils import Sequence
 from collections import defaultdict
 
@@ -271,7 +269,7 @@ class GraphSAGENodeGenerator(BatchedNodeGenerator):
         # Reshape node samples to sensible format
         def get_levels(loc, lsize, samples_per_hop, walks):
             end_loc = loc + lsize
-            walks_at_level = list(it.chain(*[w[loc:end_loc] for w in walks]))
+            walks_at_level = list(it.chain.from_iterable(w[loc:end_loc] for w in walks))
             if len(samples_per_hop) < 1:
                 return [walks_at_level]
             return [walks_at_level] + get_levels(
@@ -414,7 +412,9 @@ class DirectedGraphSAGENodeGenerator(BatchedNodeGenerator):
         features = [None] * max_slots  # flattened binary tree
 
         for slot in range(max_slots):
-            nodes_in_slot = list(it.chain(*[sample[slot] for sample in node_samples]))
+            nodes_in_slot = list(
+                it.chain.from_iterable(sample[slot] for sample in node_samples)
+            )
             features_for_slot = self.graph.node_features(
                 nodes_in_slot, node_type, use_ilocs=True
             )
@@ -539,10 +539,10 @@ class HinSAGENodeGenerator(BatchedNodeGenerator):
         nodes_by_type = [
             (
                 nt,
-                reduce(
-                    operator.concat,
-                    (samples[ks] for samples in node_samples for ks in indices),
-                    [],
+                list(
+                    it.chain.from_iterable(
+                        samples[ks] for samples in node_samples for ks in indices
+                    )
                 ),
             )
             for nt, indices in self._sampling_schema[0]
@@ -20,7 +20,9 @@ import pandas as pd
 import pytest
 import random
 from stellargraph.core.graph import *
+from stellargraph.core.element_data import NodeData, EdgeData
 from stellargraph.core.indexed_array import IndexedArray
+from stellargraph.core.schema import EdgeType
 from stellargraph.core.experimental import ExperimentalWarning
 from ..test_utils.alloc import snapshot, peak, allocation_benchmark
 from ..test_utils.graphs import (
@@ -360,6 +362,96 @@ def test_graph_schema_sampled():
     assert len(schema.schema["user"]) == 1
 
 
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_graph_schema_sampled_subset_of_edge_types(is_directed):
+    sg = example_hin_1(is_directed=is_directed)
+
+    # only the R edges 4 -> 0 and 1 -> 4 are between these nodes (and these aren't the first
+    # edges stored, which are the F ones); 6 is isolated and 7 doesn't exist
+    schema = sg.create_graph_schema(nodes=[0, 1, 4, 6, 7])
+
+    a_r_b = EdgeType("A", "R", "B")
+    b_r_a = EdgeType("B", "R", "A")
+    assert schema.edge_types == [a_r_b, b_r_a]
+    assert schema.schema["A"] == [a_r_b]
+    assert schema.schema["B"] == [b_r_a]
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_graph_schema_sampled_matches_edges(is_directed):
+    sg = example_graph_random(
+        n_nodes=10, n_edges=30, node_types=3, edge_types=3, is_directed=is_directed
+    )
+    sources, targets, rels, _ = sg.edge_arrays(include_edge_type=True)
+    all_nodes = list(sg.nodes())
+
+    for _ in range(20):
+        nodes = random.sample(all_nodes, k=12)
+        schema = sg.create_graph_schema(nodes=nodes)
+
+        # the schema should consist of exactly the edge types of edges with both endpoints selected
+        expected = set()
+        for src, tgt, rel in zip(sources, targets, rels):
+            if src in nodes and tgt in nodes:
+                n1, n2 = sg.node_type(src), sg.node_type(tgt)
+                expected.add(EdgeType(n1, rel, n2))
+                if not is_directed:
+                    expected.add(EdgeType(n2, rel, n1))
+
+        assert schema.edge_types == sorted(expected)
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_graph_schema_sorted(knowledge_graph, weighted_hin, is_directed):
+    graphs = [
+        knowledge_graph,
+        weighted_hin,
+        example_hin_1(is_directed=is_directed, self_loop=True, reverse_order=True),
+    ]
+    for sg in graphs:
+        schema = sg.create_graph_schema()
+
+        assert schema.node_types == sorted(sg.node_types)
+        assert schema.edge_types == sorted(schema.edge_types)
+        assert len(set(schema.edge_types)) == len(schema.edge_types)
+        for nt, edge_types in schema.schema.items():
+            assert edge_types == sorted(et for et in schema.edge_types if et.n1 == nt)
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_graph_schema_sorted_unsorted_types(is_directed):
+    # the converters always store types sorted, so construct the internal data directly to have
+    # the edge types come out of the graph in an unsorted order
+    nodes = NodeData([0, 1, 2, 3], [("b", np.zeros((2, 0))), ("a", np.zeros((2, 0)))])
+    edges = EdgeData(
+        [10, 11, 12, 13],
+        np.array([0, 2, 1, 3]),
+        np.array([2, 0, 1, 0]),
+        np.ones(4),
+        [("y", np.zeros((2, 0))), ("x", np.zeros((2, 0)))],
+        len(nodes),
+    )
+    assert not nodes.types.pandas_index.is_monotonic_increasing
+    assert not edges.types.pandas_index.is_monotonic_increasing
+
+    cls = StellarDiGraph if is_directed else StellarGraph
+    schema = cls(nodes, edges).create_graph_schema()
+
+    b_y_a = EdgeType("b", "y", "a")
+    a_y_b = EdgeType("a", "y", "b")
+    b_x_b = EdgeType("b", "x", "b")
+    a_x_b = EdgeType("a", "x", "b")
+    if is_directed:
+        expected = sorted([b_y_a, a_y_b, b_x_b, a_x_b])
+    else:
+        expected = sorted([b_y_a, a_y_b, b_x_b, a_x_b, EdgeType("b", "x", "a")])
+
+    assert schema.node_types == ["a", "b"]
+    assert schema.edge_types == expected
+    for nt, edge_types in schema.schema.items():
+        assert edge_types == [et for et in expected if et.n1 == nt]
+
+
 def test_digraph_schema():
     sg = create_graph_1(is_directed=True)
     schema = sg.create_graph_schema()
@@ -2042,6 +2134,11 @@ def test_node_type():
     with pytest.raises(KeyError, match="1234"):
         g.node_type(1234)
 
+    np.testing.assert_array_equal(g.node_type([4, 0, 5]), ["B", "A", "B"])
+
+    with pytest.raises(KeyError, match="1234"):
+        g.node_type([0, 1234])
+
 
 def test_from_networkx_empty():
     empty = StellarGraph.from_networkx(nx.Graph())
@@ -2208,6 +2305,29 @@ def test_nodes_node_type_filter(use_ilocs):
         g.nodes(node_type="C")
 
 
+@pytest.mark.parametrize("use_ilocs", [True, False])
+def test_node_arrays(use_ilocs):
+    g = example_hin_1(reverse_order=True)
+
+    ids, types = g.node_arrays(use_ilocs=use_ilocs)
+    assert types is None
+
+    ids, types = g.node_arrays(include_node_type=True, use_ilocs=use_ilocs)
+    if use_ilocs:
+        np.testing.assert_array_equal(ids, range(7))
+        np.testing.assert_array_equal(
+            types, g.node_type_names_to_ilocs(["A"] * 4 + ["B"] * 3)
+        )
+    else:
+        np.testing.assert_array_equal(ids, [3, 2, 1, 0, 6, 5, 4])
+        np.testing.assert_array_equal(types, ["A"] * 4 + ["B"] * 3)
+
+    # consistent with the per-node accessors
+    np.testing.assert_array_equal(ids, g.nodes(use_ilocs=use_ilocs))
+    type_names = g.node_type_ilocs_to_names(types) if use_ilocs else types
+    np.testing.assert_array_equal(type_names, g.node_type(ids, use_ilocs=use_ilocs))
+
+
 def test_nodes_of_type_deprecation():
     g = example_hin_1(reverse_order=True)
     with pytest.warns(DeprecationWarning, match="'nodes_of_type' is deprecated"):
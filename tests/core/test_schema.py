@@ -50,6 +50,9 @@ def test_homogeneous_graph_schema(example_graph_schema):
     assert gs.node_index("A") == 0
     assert gs.node_index("B") == 1
 
+    with pytest.warns(RuntimeWarning, match="Node key 'C' not found"):
+        assert gs.node_index("C") is None
+
     assert gs.edge_index(EdgeType("A", "a0", "A")) == 0
     assert gs.edge_index(EdgeType("A", "ab0", "B")) == 1
     assert gs.edge_index(EdgeType("B", "ab0", "A")) == 2
@@ -89,6 +92,30 @@ def test_graph_schema_sampling(example_graph_schema):
             assert set(adj_types) == set(list_types)
 
 
+def test_graph_schema_sampling_cached(example_graph_schema):
+    schema = example_graph_schema(bb=0)
+
+    type_list = schema.type_adjacency_list(["A", "B"], n_hops=2)
+    expected = [(nt, list(children)) for nt, children in type_list]
+
+    # modifying the result shouldn't affect later calls
+    type_list[0][1].append(100)
+    type_list.append(("C", []))
+
+    assert schema.type_adjacency_list(["A", "B"], n_hops=2) == expected
+    assert schema.type_adjacency_list(("A", "B"), n_hops=2) == expected
+    assert schema.type_adjacency_list(["A", "B"], n_hops=1) != expected
+
+    # nor should modifying the adjacency list returned with a sampling tree
+    tree_list, _ = schema.sampling_tree(["A", "B"], n_hops=2)
+    assert tree_list == expected
+    tree_list[0][1].append(99)
+
+    assert schema.type_adjacency_list(["A", "B"], n_hops=2) == expected
+    tree_list, _ = schema.sampling_tree(["A", "B"], n_hops=2)
+    assert tree_list == expected
+
+
 def test_graph_schema_sampling_layout_1(example_graph_schema):
     # Create dummy graph schema
     schema = example_graph_schema(aa=0, bb=0)
@@ -182,3 +209,28 @@ def test_graph_schema_sampling_layout_multiple(example_graph_schema):
         ("A", [2, 4]),
         ("B", [3, 5]),
     ]
+
+
+def test_graph_schema_sampling_tree_deep(example_graph_schema):
+    # a single chain of A nodes, deeper than Python's default recursion limit
+    schema = example_graph_schema(aa=1, ab=0, ba=0, bb=0)
+    n_hops = 5000
+    _, type_tree = schema.sampling_tree(["A"], n_hops)
+
+    node = type_tree[0]
+    for expected_index in range(n_hops):
+        assert node[:2] == (expected_index, "A")
+        (node,) = node[2]
+
+    assert node == (n_hops, "A", [])
+
+
+@pytest.mark.benchmark(group="GraphSchema type_adjacency_list")
+@pytest.mark.parametrize("n_hops", [2, 6])
+def test_benchmark_type_adjacency_list(benchmark, example_graph_schema, n_hops):
+    def f():
+        # a new schema each time, so that the sampling tree isn't cached between rounds
+        schema = example_graph_schema(aa=2, ab=2, ba=2, bb=2)
+        return schema.type_adjacency_list(["A", "B"], n_hops)
+
+    benchmark(f)